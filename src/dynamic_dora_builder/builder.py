@@ -1,13 +1,73 @@
+import functools
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import jinja2
 from jinja2 import defaults, meta
 import yaml
 
 from .models import Dataflow, DeploymentConfig, DynamicNode, Node, Operator
-from .yaml_utils import dump_yaml
+from .yaml_utils import dump_yaml, load_yaml_file, safe_load
+
+
+@functools.lru_cache(maxsize=None)
+def _bytecode_cache() -> Optional[jinja2.BytecodeCache]:
+    try:
+        return jinja2.FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template_vars(path: str, mtime_ns: int, size: int) -> dict:
+    try:
+        parsed = load_yaml_file(path) or {}
+    except (OSError, yaml.YAMLError):
+        return {}
+    if isinstance(parsed, dict):
+        vars_section = parsed.get("vars")
+        if isinstance(vars_section, dict):
+            return vars_section
+    return {}
+
+
+@functools.lru_cache(maxsize=8)
+def _command_root(cwd: str) -> Path:
+    return Path(os.path.realpath(cwd))
+
+
+_parse_env = jinja2.Environment()
+
+
+@functools.lru_cache(maxsize=128)
+def _find_undeclared_variables(source: str) -> frozenset:
+    return frozenset(meta.find_undeclared_variables(_parse_env.parse(source)))
+
+
+def _try_stat(path: str) -> bool:
+    try:
+        os.stat(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+@dataclass
+class _BuildCache:
+    template_envs: Dict[Path, jinja2.Environment] = field(default_factory=dict)
+    resolved_paths: Dict[Tuple[str, Path, Path], str] = field(default_factory=dict)
+    existing_paths: Dict[str, bool] = field(default_factory=dict)
+    environ: Dict[str, str] = field(default_factory=lambda: dict(os.environ))
+    dataflow_nodes: Dict[str, Dict[str, Node]] = field(default_factory=dict)
+
+    def exists(self, path: str) -> bool:
+        exists = self.existing_paths.get(path)
+        if exists is None:
+            exists = _try_stat(path)
+            self.existing_paths[path] = exists
+        return exists
 
 
 class DynamicDataflowBuilder:
@@ -15,8 +75,8 @@ class DynamicDataflowBuilder:
     def build(
         cls, deployment_path: Path, export_path: Optional[Path] = None
     ) -> Dataflow:
-        command_root = Path.cwd().resolve()
-        deployment_path = deployment_path.resolve()
+        command_root = _command_root(os.getcwd())
+        deployment_path = Path(os.path.realpath(deployment_path))
 
         dataflow = cls._build_dataflow(deployment_path, command_root)
         cls._relativize_dataflow_paths(dataflow, command_root)
@@ -24,95 +84,95 @@ class DynamicDataflowBuilder:
         if export_path:
             normalized_export_path = cls._prepare_export_path(export_path, command_root)
             normalized_export_path.write_text(
-                dump_yaml(dataflow.model_dump(exclude_none=True))
+                dump_yaml(dataflow.to_yaml_dict())
             )
 
         return dataflow
 
     @classmethod
     def _build_dataflow(cls, deployment_path: Path, command_root: Path) -> Dataflow:
+        cache = _BuildCache()
         rendered_deployment = cls._render_deployment_template(
-            deployment_path, command_root
-        )
-        deployment = DeploymentConfig.model_validate(
-            yaml.safe_load(rendered_deployment) or {}
+            deployment_path, command_root, cache
         )
+        parsed_deployment = safe_load(rendered_deployment) or {}
+        if cache.environ.get("DDB_FAST") == "1":
+            deployment = DeploymentConfig.unsafe_from_dict(parsed_deployment)
+        else:
+            deployment = DeploymentConfig.model_validate(parsed_deployment)
         deployment_dir = deployment_path.parent
         deployment_vars = deployment.vars or {}
 
         dataflow = Dataflow()
+        emitted_dynamic_nodes = set()
         for node in deployment.nodes:
             if isinstance(node, Node):
                 dataflow.nodes.append(
-                    cls._normalize_node(node, deployment_dir, command_root)
+                    cls._normalize_node(node, deployment_dir, command_root, cache)
                 )
             elif isinstance(node, Operator):
                 dataflow.nodes.append(
-                    cls._normalize_operator(node, deployment_dir, command_root)
+                    cls._normalize_operator(
+                        node, deployment_dir, command_root, cache
+                    )
                 )
             elif isinstance(node, DynamicNode):
-                resolved_dynamic_path = cls._resolve_path_for_io(
-                    node.path, deployment_dir, command_root
-                )
-                loaded_dataflow = cls._load_dataflow_from_path(
-                    resolved_dynamic_path, command_root
-                )
-                matched = next(
-                    (
-                        n
-                        for n in loaded_dataflow.nodes
-                        if isinstance(n, Node) and n.id == node.id
-                    ),
-                    None,
+                resolved_dynamic_path = cls._resolve_path_value(
+                    node.path, deployment_dir, command_root, cache
                 )
+                matched = cls._load_nodes_by_id(
+                    resolved_dynamic_path, command_root, cache
+                ).get(node.id)
                 if matched:
+                    if id(matched) in emitted_dynamic_nodes:
+                        matched = matched.model_copy(deep=True)
+                    else:
+                        emitted_dynamic_nodes.add(id(matched))
                     dataflow.nodes.append(matched)
 
         for component in deployment.components:
-            component_path = cls._resolve_path_for_io(
-                component.path, deployment_dir, command_root
-            )
-            template_env = jinja2.Environment(
-                loader=jinja2.FileSystemLoader(str(component_path.parent)),
-                undefined=jinja2.StrictUndefined,
+            component_path = Path(
+                cls._resolve_path_value(
+                    component.path, deployment_dir, command_root, cache
+                )
             )
+            template_env = cls._get_env(cache, component_path.parent)
             template = template_env.get_template(component_path.name)
             merged_vars = {**deployment_vars, **(component.vars or {})}
             component_context = {
                 **merged_vars,
                 "vars": merged_vars,
-                "env": os.environ,
+                "env": cache.environ,
                 "cwd": str(command_root),
             }
             cls._validate_template_variables(
                 template_env, component_path.name, component_context.keys()
             )
             rendered_dataflow = template.render(component_context)
-            replaced_dataflow = yaml.safe_load(rendered_dataflow) or {}
+            replaced_dataflow = safe_load(rendered_dataflow) or {}
 
             loaded_dataflow = Dataflow.model_validate(replaced_dataflow)
-            normalized = cls._normalize_dataflow(
-                loaded_dataflow, component_path.parent, command_root
+            cls._normalize_nodes_in_place(
+                loaded_dataflow, component_path.parent, command_root, cache
             )
-            for node in normalized.nodes:
-                dataflow.nodes.append(node)
+            dataflow.nodes.extend(loaded_dataflow.nodes)
 
         return dataflow
 
     @classmethod
     def _render_deployment_template(
-        cls, deployment_path: Path, command_root: Path
+        cls,
+        deployment_path: Path,
+        command_root: Path,
+        cache: _BuildCache,
     ) -> str:
-        template_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(deployment_path.parent)),
-            undefined=jinja2.StrictUndefined,
-        )
+        template_env = cls._get_env(cache, deployment_path.parent)
         template_vars = cls._extract_vars_from_template(deployment_path)
         template = template_env.get_template(deployment_path.name)
         context = {
             **template_vars,
             "vars": template_vars,
-            "env": os.environ,
+            "env": cache.environ,
             "cwd": str(command_root),
         }
         cls._validate_template_variables(
@@ -120,21 +180,28 @@ class DynamicDataflowBuilder:
         )
         return template.render(context)
 
+    @staticmethod
+    def _get_env(cache: _BuildCache, search_dir: Path) -> jinja2.Environment:
+        template_env = cache.template_envs.get(search_dir)
+        if template_env is None:
+            template_env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(str(search_dir)),
+                undefined=jinja2.StrictUndefined,
+                auto_reload=False,
+                bytecode_cache=_bytecode_cache(),
+            )
+            cache.template_envs[search_dir] = template_env
+        return template_env
+
     @staticmethod
     def _extract_vars_from_template(deployment_path: Path) -> dict:
         try:
-            raw_content = deployment_path.read_text()
+            stat = os.stat(deployment_path)
         except OSError:
             return {}
-        try:
-            parsed = yaml.safe_load(raw_content) or {}
-        except yaml.YAMLError:
-            return {}
-        if isinstance(parsed, dict):
-            vars_section = parsed.get("vars")
-            if isinstance(vars_section, dict):
-                return vars_section
-        return {}
+        return dict(
+            _load_template_vars(str(deployment_path), stat.st_mtime_ns, stat.st_size)
+        )
 
     @staticmethod
     def _validate_template_variables(
@@ -144,8 +211,7 @@ class DynamicDataflowBuilder:
             source, _, _ = template_env.loader.get_source(template_env, template_name)
         except Exception:
             return
-        ast = template_env.parse(source)
-        undeclared = meta.find_undeclared_variables(ast)
+        undeclared = _find_undeclared_variables(source)
         allowed_defaults = set(defaults.DEFAULT_NAMESPACE.keys())
         allowed = set(allowed_names) | allowed_defaults
         missing = sorted(name for name in undeclared if name not in allowed)
@@ -154,106 +220,137 @@ class DynamicDataflowBuilder:
                 f"Undefined Jinja variables in {template_name}: {', '.join(missing)}"
             )
 
-    @staticmethod
-    def _resolve_path_for_io(raw_path: str, base_dir: Path, command_root: Path) -> Path:
-        path = Path(raw_path)
-        if not path.is_absolute():
-            base_candidate = (base_dir / path).resolve()
-            if base_candidate.exists():
-                return base_candidate
-            fallback_candidate = (command_root / path).resolve()
-            if fallback_candidate.exists():
-                return fallback_candidate
-            return base_candidate
-        return path.resolve()
-
     @classmethod
-    def _normalize_node(cls, node: Node, base_dir: Path, command_root: Path) -> Node:
-        node_copy = node.model_copy(deep=True)
-        if node_copy.path:
-            node_copy.path = str(
-                cls._resolve_path_value(node_copy.path, base_dir, command_root)
-            )
-        if node_copy.operator:
-            node_copy.operator = cls._normalize_operator(
-                node_copy.operator, base_dir, command_root
+    def _normalize_node(
+        cls, node: Node, base_dir: Path, command_root: Path, cache: _BuildCache
+    ) -> Node:
+        update = {}
+        if node.path:
+            path = cls._resolve_path_value(node.path, base_dir, command_root, cache)
+            if path != node.path:
+                update["path"] = path
+        if node.operator:
+            operator = cls._normalize_operator(
+                node.operator, base_dir, command_root, cache
             )
-        return node_copy
+            if operator is not node.operator:
+                update["operator"] = operator
+        if not update:
+            return node
+        return node.model_copy(update=update)
 
     @classmethod
     def _normalize_operator(
-        cls, operator: Operator, base_dir: Path, command_root: Path
+        cls,
+        operator: Operator,
+        base_dir: Path,
+        command_root: Path,
+        cache: _BuildCache,
     ) -> Operator:
-        operator_copy = operator.model_copy(deep=True)
-        if operator_copy.python:
-            operator_copy.python = str(
-                cls._resolve_path_value(operator_copy.python, base_dir, command_root)
+        if operator.python:
+            python = cls._resolve_path_value(
+                operator.python, base_dir, command_root, cache
             )
-        return operator_copy
+            if python != operator.python:
+                return operator.model_copy(update={"python": python})
+        return operator
+
+    @classmethod
+    def _resolve_path_value(
+        cls, raw_path: str, base_dir: Path, command_root: Path, cache: _BuildCache
+    ) -> str:
+        key = (raw_path, base_dir, command_root)
+        resolved = cache.resolved_paths.get(key)
+        if resolved is None:
+            resolved = cls._probe_path(raw_path, base_dir, command_root, cache)
+            cache.resolved_paths[key] = resolved
+        return resolved
 
     @staticmethod
-    def _resolve_path_value(raw_path: str, base_dir: Path, command_root: Path) -> Path:
-        path = Path(raw_path)
-        if path.is_absolute():
-            return path.resolve()
-        base_candidate = (base_dir / path).resolve()
-        if base_candidate.exists():
+    def _probe_path(
+        raw_path: str, base_dir: Path, command_root: Path, cache: _BuildCache
+    ) -> str:
+        if os.path.isabs(raw_path):
+            return os.path.realpath(raw_path)
+        base_candidate = os.path.realpath(os.path.join(base_dir, raw_path))
+        if cache.exists(base_candidate):
             return base_candidate
-        fallback_candidate = (command_root / path).resolve()
-        if fallback_candidate.exists():
+        fallback_candidate = os.path.realpath(os.path.join(command_root, raw_path))
+        if cache.exists(fallback_candidate):
             return fallback_candidate
         return base_candidate
 
     @classmethod
-    def _normalize_dataflow(
-        cls, dataflow: Dataflow, base_dir: Path, command_root: Path
-    ) -> Dataflow:
-        normalized = Dataflow()
-        for node in dataflow.nodes:
-            if isinstance(node, Node):
-                normalized.nodes.append(
-                    cls._normalize_node(node, base_dir, command_root)
-                )
-            elif isinstance(node, Operator):
-                normalized.nodes.append(
-                    cls._normalize_operator(node, base_dir, command_root)
-                )
-        return normalized
+    def _normalize_nodes_in_place(
+        cls,
+        dataflow: Dataflow,
+        base_dir: Path,
+        command_root: Path,
+        cache: _BuildCache,
+    ) -> None:
+        dataflow.nodes[:] = [
+            cls._normalize_node(node, base_dir, command_root, cache)
+            if isinstance(node, Node)
+            else cls._normalize_operator(node, base_dir, command_root, cache)
+            for node in dataflow.nodes
+        ]
 
     @classmethod
-    def _load_dataflow_from_path(cls, path: Path, command_root: Path) -> Dataflow:
-        rendered = yaml.safe_load(path.read_text()) or {}
+    def _load_nodes_by_id(
+        cls, path: str, command_root: Path, cache: _BuildCache
+    ) -> Dict[str, Node]:
+        nodes_by_id = cache.dataflow_nodes.get(path)
+        if nodes_by_id is None:
+            loaded_dataflow = cls._load_dataflow_from_path(
+                Path(path), command_root, cache
+            )
+            nodes_by_id = {
+                n.id: n for n in reversed(loaded_dataflow.nodes) if isinstance(n, Node)
+            }
+            cache.dataflow_nodes[path] = nodes_by_id
+        return nodes_by_id
+
+    @classmethod
+    def _load_dataflow_from_path(
+        cls, path: Path, command_root: Path, cache: _BuildCache
+    ) -> Dataflow:
+        rendered = load_yaml_file(path) or {}
         dataflow = Dataflow.model_validate(rendered)
-        return cls._normalize_dataflow(dataflow, path.parent, command_root)
+        cls._normalize_nodes_in_place(dataflow, path.parent, command_root, cache)
+        return dataflow
 
     @staticmethod
-    def _relativize_path(value: str, root: Path) -> str:
-        candidate = Path(value)
-        if not candidate.is_absolute():
-            candidate = (root / candidate).resolve()
+    def _relativize_path(value: str, root_prefix: str) -> str:
+        if os.path.isabs(value):
+            if value.startswith(root_prefix):
+                return value[len(root_prefix) :]
+            absolute = os.path.realpath(value)
         else:
-            candidate = candidate.resolve()
-        return os.path.relpath(candidate, root)
+            if ".." not in value.split(os.sep):
+                return os.path.normpath(value)
+            absolute = os.path.realpath(os.path.join(root_prefix, value))
+        return os.path.relpath(absolute, root_prefix)
 
     @classmethod
-    def _relativize_operator_paths(cls, operator: Operator, root: Path) -> None:
+    def _relativize_operator_paths(cls, operator: Operator, root_prefix: str) -> None:
         if operator.python:
-            operator.python = cls._relativize_path(operator.python, root)
+            operator.python = cls._relativize_path(operator.python, root_prefix)
 
     @classmethod
-    def _relativize_node_paths(cls, node: Node, root: Path) -> None:
+    def _relativize_node_paths(cls, node: Node, root_prefix: str) -> None:
         if node.path:
-            node.path = cls._relativize_path(node.path, root)
+            node.path = cls._relativize_path(node.path, root_prefix)
         if node.operator:
-            cls._relativize_operator_paths(node.operator, root)
+            cls._relativize_operator_paths(node.operator, root_prefix)
 
     @classmethod
     def _relativize_dataflow_paths(cls, dataflow: Dataflow, root: Path) -> None:
+        root_prefix = os.path.join(str(root), "")
         for node in dataflow.nodes:
             if isinstance(node, Node):
-                cls._relativize_node_paths(node, root)
+                cls._relativize_node_paths(node, root_prefix)
             elif isinstance(node, Operator):
-                cls._relativize_operator_paths(node, root)
+                cls._relativize_operator_paths(node, root_prefix)
 
     @staticmethod
     def _prepare_export_path(export_path: Path, command_root: Path) -> Path:
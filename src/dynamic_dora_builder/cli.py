@@ -11,7 +11,7 @@ from .yaml_utils import dump_yaml
 
 
 def _dump_dataflow_to_stdout(dataflow: Dataflow) -> None:
-    rendered = dump_yaml(dataflow.model_dump(exclude_none=True))
+    rendered = dump_yaml(dataflow.to_yaml_dict())
     sys.stdout.write(rendered)
 
 
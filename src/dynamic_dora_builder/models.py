@@ -1,17 +1,35 @@
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 
 
-class Dataflow(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True, union_mode="left_to_right"
-    )
+def _node_kind(value: Any) -> str:
+    if isinstance(value, dict):
+        if value.get("kind") == "dynamic":
+            return "dynamic"
+        return "node" if "id" in value else "operator"
+    if isinstance(value, DynamicNode):
+        return "dynamic"
+    if isinstance(value, Node):
+        return "node"
+    return "operator"
+
 
-    nodes: List[Union["Node", "Operator"]] = Field(
+class Dataflow(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    nodes: List[
+        Annotated[
+            Union[Annotated["Node", Tag("node")], Annotated["Operator", Tag("operator")]],
+            Discriminator(_node_kind),
+        ]
+    ] = Field(
         default=[], description="List of nodes and operators in the dataflow"
     )
 
+    def to_yaml_dict(self) -> Dict[str, Any]:
+        return {"nodes": [node.to_yaml_dict() for node in self.nodes]}
+
 
 class Node(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -45,6 +63,26 @@ class Node(BaseModel):
     def config(self) -> Dict[str, str]:
         return self.model_dump()
 
+    def to_yaml_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"id": self.id}
+        if self.path is not None:
+            out["path"] = self.path
+        if self.env is not None:
+            out["env"] = self.env
+        if self.name is not None:
+            out["name"] = self.name
+        if self.build is not None:
+            out["build"] = self.build
+        if self.operator is not None:
+            out["operator"] = self.operator.to_yaml_dict()
+        if self.inputs is not None:
+            out["inputs"] = self.inputs
+        if self.outputs is not None:
+            out["outputs"] = self.outputs
+        if self.args is not None:
+            out["args"] = self.args
+        return out
+
 
 class Operator(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -72,16 +110,41 @@ class Operator(BaseModel):
         description="Command-line arguments passed to the operator executable (list or string)",
     )
 
+    def to_yaml_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        if self.build is not None:
+            out["build"] = self.build
+        if self.description is not None:
+            out["description"] = self.description
+        if self.python is not None:
+            out["python"] = self.python
+        if self.inputs is not None:
+            out["inputs"] = self.inputs
+        if self.env is not None:
+            out["env"] = self.env
+        if self.outputs is not None:
+            out["outputs"] = self.outputs
+        if self.args is not None:
+            out["args"] = self.args
+        return out
+
 
 class DeploymentConfig(BaseModel):
-    model_config = ConfigDict(
-        arbitrary_types_allowed=True, union_mode="left_to_right"
-    )
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     vars: Optional[Dict[str, Any]] = Field(
         default=None, description="Jinja template variables available as plain keys or under vars"
     )
-    nodes: List[Union[Node, Operator, "DynamicNode"]] = Field(
+    nodes: List[
+        Annotated[
+            Union[
+                Annotated[Node, Tag("node")],
+                Annotated[Operator, Tag("operator")],
+                Annotated["DynamicNode", Tag("dynamic")],
+            ],
+            Discriminator(_node_kind),
+        ]
+    ] = Field(
         default=[],
         description="List of nodes, operators, and dynamic nodes in the deployment",
     )
@@ -89,6 +152,29 @@ class DeploymentConfig(BaseModel):
         default=[], description="List of dynamic components in the deployment"
     )
 
+    @classmethod
+    def unsafe_from_dict(cls, data: Dict[str, Any]) -> "DeploymentConfig":
+        nodes: List[Union[Node, Operator, DynamicNode]] = []
+        for raw in data.get("nodes") or []:
+            kind = _node_kind(raw)
+            if kind == "dynamic":
+                nodes.append(DynamicNode.model_construct(**raw))
+            elif kind == "node":
+                fields = dict(raw)
+                if fields.get("operator") is not None:
+                    fields["operator"] = Operator.model_construct(**fields["operator"])
+                nodes.append(Node.model_construct(**fields))
+            else:
+                nodes.append(Operator.model_construct(**raw))
+        return cls.model_construct(
+            vars=data.get("vars"),
+            nodes=nodes,
+            components=[
+                DynamicComponent.model_construct(**component)
+                for component in data.get("components") or []
+            ],
+        )
+
 
 class DynamicNode(BaseModel):
     id: str = Field(..., description="Unique identifier for the dynamic node")
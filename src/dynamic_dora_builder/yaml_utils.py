@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import os
 from typing import Any
 
 import yaml
 
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class _IndentedSafeDumper(yaml.SafeDumper):
     def increase_indent(self, flow: bool = False, indentless: bool = False):
         return super().increase_indent(flow, indentless=False)
 
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def safe_load(stream: Any) -> Any:
+    return yaml.load(stream, Loader=Loader)
+
+
+def load_yaml_file(path: str | os.PathLike) -> Any:
+    with open(path, "rb") as stream:
+        return safe_load(stream)
+
 
 def dump_yaml(data: Any) -> str:
     return yaml.dump(
@@ -18,4 +33,5 @@ def dump_yaml(data: Any) -> str:
         sort_keys=False,
         allow_unicode=True,
         indent=2,
+        width=1_000_000_000,
     )